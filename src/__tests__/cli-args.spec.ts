@@ -0,0 +1,46 @@
+import { describe, it, expect, vi } from 'vitest';
+import { parseCliArgs, printAiOrientedHelp } from '../cli-args.js';
+
+// Argument handling is exercised in-process: spawning `node dist/cli.js` per case
+// would pay a full Node startup (and hub/adapter boot) for pure parsing logic.
+describe('CLI argument parsing', () => {
+  it('defaults to codex as main agent', () => {
+    expect(parseCliArgs([])).toEqual({ showHelp: false, mainAgent: 'codex' });
+  });
+
+  it('accepts a supported main agent override', () => {
+    expect(parseCliArgs(['claude'])).toEqual({ showHelp: false, mainAgent: 'claude' });
+    expect(parseCliArgs([' gemini '])).toEqual({ showHelp: false, mainAgent: 'gemini' });
+  });
+
+  it('recognizes -h and --help', () => {
+    expect(parseCliArgs(['-h']).showHelp).toBe(true);
+    expect(parseCliArgs(['--help', 'claude'])).toEqual({ showHelp: true, mainAgent: 'claude' });
+  });
+
+  it('rejects unknown options and unsupported agents', () => {
+    expect(() => parseCliArgs(['--verbose'])).toThrow('Unknown option: --verbose');
+    expect(() => parseCliArgs(['cursor'])).toThrow(
+      'Unsupported main agent "cursor". Supported: codex, claude, gemini.'
+    );
+    expect(() => parseCliArgs(['codex', 'claude'])).toThrow(
+      'Unexpected positional argument: claude'
+    );
+  });
+
+  it('prints AI-oriented help text', () => {
+    const logSpy = vi.spyOn(console, 'log').mockImplementation(() => {});
+    let output = '';
+    try {
+      printAiOrientedHelp();
+      // Read the calls before mockRestore(), which also clears them.
+      output = logSpy.mock.calls.map(([message]) => String(message ?? '')).join('\n');
+    } finally {
+      logSpy.mockRestore();
+    }
+
+    expect(output).toContain('aiteam - Agent Team CLI');
+    expect(output).toContain('Main agent choices: codex, claude, gemini (default: codex)');
+    expect(output).toContain('- /status: print self/main/peer connectivity and routed counters');
+  });
+});
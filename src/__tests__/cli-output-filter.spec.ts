@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { extractConversationalText, formatCliMessage } from '../cli.js';
+import { extractConversationalText, formatCliMessage } from '../cli-output.js';
 
 describe('CLI output filter', () => {
   it('prints conversational assistant content', () => {
@@ -19,46 +19,21 @@ describe('CLI output filter', () => {
     });
   });
 
-  it('ignores codex status notifications like turn/started', () => {
+  it.each([
+    { method: 'turn/started', params: { turn: { id: 'turn_123', status: 'started' } } },
+    { method: 'token_count', params: { input_tokens: 10, output_tokens: 20 } },
+    { method: 'thread/started', params: { thread: { id: 'thread_123' } } },
+    {
+      method: 'codex/event/warning',
+      params: { msg: { type: 'warning', message: 'This is not conversational output.' } }
+    }
+  ])('ignores codex $method notifications', ({ method, params }) => {
     const formatted = formatCliMessage({
       from: 'codex',
       payload: {
         jsonrpc: '2.0',
-        method: 'turn/started',
-        params: {
-          turn: { id: 'turn_123', status: 'started' }
-        }
-      }
-    });
-
-    expect(formatted).toBeNull();
-  });
-
-  it('ignores codex token_count notifications', () => {
-    const formatted = formatCliMessage({
-      from: 'codex',
-      payload: {
-        jsonrpc: '2.0',
-        method: 'token_count',
-        params: {
-          input_tokens: 10,
-          output_tokens: 20
-        }
-      }
-    });
-
-    expect(formatted).toBeNull();
-  });
-
-  it('ignores codex thread/started notifications', () => {
-    const formatted = formatCliMessage({
-      from: 'codex',
-      payload: {
-        jsonrpc: '2.0',
-        method: 'thread/started',
-        params: {
-          thread: { id: 'thread_123' }
-        }
+        method,
+        params
       }
     });
 
@@ -131,24 +106,6 @@ describe('CLI output filter', () => {
     });
   });
 
-  it('ignores codex/event warning notifications', () => {
-    const formatted = formatCliMessage({
-      from: 'codex',
-      payload: {
-        jsonrpc: '2.0',
-        method: 'codex/event/warning',
-        params: {
-          msg: {
-            type: 'warning',
-            message: 'This is not conversational output.'
-          }
-        }
-      }
-    });
-
-    expect(formatted).toBeNull();
-  });
-
   it('prints structured adapter errors as conversational text', () => {
     const formatted = formatCliMessage({
       from: 'gemini',
@@ -0,0 +1,64 @@
+import { ChildProcess } from 'child_process';
+import * as net from 'net';
+
+// Re-checks only when the child writes to stdout/stderr instead of sleeping between polls.
+// Register the listeners that append to the output buffer before calling this so each
+// check sees the chunk that triggered it. `fromIndex` skips output that predates the
+// action being awaited when one process is shared across tests.
+export function waitForProcessOutput(
+  child: ChildProcess,
+  readOutput: () => string,
+  needle: string,
+  timeoutMs: number,
+  describeTimeout: () => string,
+  fromIndex = 0
+): Promise<void> {
+  return new Promise<void>((resolve, reject) => {
+    if (readOutput().indexOf(needle, fromIndex) >= 0) {
+      resolve();
+      return;
+    }
+
+    const onData = () => {
+      if (readOutput().indexOf(needle, fromIndex) >= 0) {
+        detach();
+        resolve();
+      }
+    };
+    const timeout = setTimeout(() => {
+      detach();
+      reject(new Error(describeTimeout()));
+    }, timeoutMs);
+    const detach = () => {
+      clearTimeout(timeout);
+      child.stdout?.off('data', onData);
+      child.stderr?.off('data', onData);
+    };
+
+    child.stdout?.on('data', onData);
+    child.stderr?.on('data', onData);
+  });
+}
+
+export async function getFreePort(): Promise<number> {
+  return new Promise<number>((resolve, reject) => {
+    const server = net.createServer();
+    server.unref();
+    server.on('error', reject);
+    server.listen(0, '127.0.0.1', () => {
+      const address = server.address();
+      if (!address || typeof address === 'string') {
+        server.close(() => reject(new Error('Failed to allocate a test port.')));
+        return;
+      }
+      const selectedPort = address.port;
+      server.close((closeErr) => {
+        if (closeErr) {
+          reject(closeErr);
+          return;
+        }
+        resolve(selectedPort);
+      });
+    });
+  });
+}
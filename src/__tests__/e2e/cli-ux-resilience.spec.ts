@@ -1,9 +1,9 @@
-import { describe, it, expect } from 'vitest';
+import { describe, it, expect, beforeAll, afterAll } from 'vitest';
 import { spawn, ChildProcess } from 'child_process';
 import * as path from 'path';
 import * as url from 'url';
-import * as net from 'net';
 import { setTimeout as sleep } from 'timers/promises';
+import { getFreePort, waitForProcessOutput } from './cli-process-harness.js';
 
 const __dirname = url.fileURLToPath(new URL('.', import.meta.url));
 const CLI_PATH = path.resolve(__dirname, '../../../dist/cli.js');
@@ -11,33 +11,12 @@ const CLI_PATH = path.resolve(__dirname, '../../../dist/cli.js');
 type CliHarness = {
   process: ChildProcess;
   getOutput: () => string;
+  mark: () => number;
   sendLine: (line: string) => void;
-  waitForText: (needle: string, timeoutMs?: number) => Promise<void>;
+  waitForText: (needle: string, timeoutMs?: number, fromIndex?: number) => Promise<void>;
   stop: () => Promise<void>;
 };
 
-async function getFreePort(): Promise<number> {
-  return new Promise<number>((resolve, reject) => {
-    const server = net.createServer();
-    server.on('error', reject);
-    server.listen(0, '127.0.0.1', () => {
-      const address = server.address();
-      if (!address || typeof address === 'string') {
-        server.close(() => reject(new Error('Failed to allocate free port')));
-        return;
-      }
-      const selected = address.port;
-      server.close((closeErr) => {
-        if (closeErr) {
-          reject(closeErr);
-          return;
-        }
-        resolve(selected);
-      });
-    });
-  });
-}
-
 async function startCliHarness(): Promise<CliHarness> {
   const port = await getFreePort();
   const cliProcess = spawn('node', [CLI_PATH], {
@@ -57,16 +36,15 @@ async function startCliHarness(): Promise<CliHarness> {
     outputBuffer += data.toString();
   });
 
-  const waitForText = async (needle: string, timeoutMs = 15000) => {
-    const deadline = Date.now() + timeoutMs;
-    while (Date.now() < deadline) {
-      if (outputBuffer.includes(needle)) {
-        return;
-      }
-      await sleep(100);
-    }
-    throw new Error(`Timeout waiting for "${needle}"\nOutput tail:\n${outputBuffer.slice(-1200)}`);
-  };
+  const waitForText = (needle: string, timeoutMs = 15000, fromIndex = 0) =>
+    waitForProcessOutput(
+      cliProcess,
+      () => outputBuffer,
+      needle,
+      timeoutMs,
+      () => `Timeout waiting for "${needle}"\nOutput tail:\n${outputBuffer.slice(-1200)}`,
+      fromIndex
+    );
 
   await waitForText('--- aiteam CLI ---');
   await waitForText('Main agent: codex (default: codex)');
@@ -90,54 +68,67 @@ async function startCliHarness(): Promise<CliHarness> {
   return {
     process: cliProcess,
     getOutput: () => outputBuffer,
+    mark: () => outputBuffer.length,
     sendLine,
     waitForText,
     stop
   };
 }
 
+// One CLI process (hub + adapters) is shared across these tests; each test only awaits
+// output produced after its own mark so earlier tests cannot satisfy its waits.
 describe('E2E: CLI UX and input resilience', () => {
-  it('shows startup help-oriented guidance', async () => {
-    const harness = await startCliHarness();
-    try {
-      const output = harness.getOutput();
-      expect(output).toContain('--- aiteam CLI ---');
-      expect(output).toContain('Main agent: codex (default: codex)');
-      expect(output).toContain('Available agents: codex, claude, gemini');
-      expect(output).toContain('Type plain text to send tasks to codex.');
-      expect(output).toContain('Type "/status" to inspect self/peer connection states.');
-      expect(output.toLowerCase()).not.toContain('tmux helper');
-    } finally {
-      await harness.stop();
+  let harness: CliHarness | undefined;
+
+  const requireHarness = (): CliHarness => {
+    if (!harness) {
+      throw new Error('CLI harness is not running (startup failed in beforeAll).');
     }
+    return harness;
+  };
+
+  beforeAll(async () => {
+    harness = await startCliHarness();
   }, 30000);
 
-  it('prints a clear hint for malformed explicit route', async () => {
-    const harness = await startCliHarness();
-    try {
-      harness.sendLine('@codex');
-      await harness.waitForText('Invalid format. Use "@agent message".');
-      expect(harness.getOutput()).toContain('Invalid format. Use "@agent message".');
-    } finally {
-      await harness.stop();
+  afterAll(async () => {
+    if (!harness) {
+      return;
     }
+    await harness.stop();
+    expect(harness.process.killed || harness.process.exitCode !== null).toBe(true);
+  }, 15000);
+
+  it('shows startup help-oriented guidance', () => {
+    const output = requireHarness().getOutput();
+    expect(output).toContain('--- aiteam CLI ---');
+    expect(output).toContain('Main agent: codex (default: codex)');
+    expect(output).toContain('Available agents: codex, claude, gemini');
+    expect(output).toContain('Type plain text to send tasks to codex.');
+    expect(output).toContain('Type "/status" to inspect self/peer connection states.');
+    expect(output.toLowerCase()).not.toContain('tmux helper');
+  });
+
+  it('prints a clear hint for malformed explicit route', async () => {
+    const harness = requireHarness();
+    const mark = harness.mark();
+    harness.sendLine('@codex');
+    await harness.waitForText('Invalid format. Use "@agent message".', undefined, mark);
+    expect(harness.getOutput().slice(mark)).toContain('Invalid format. Use "@agent message".');
   }, 30000);
 
   it('accepts /status and stays responsive after malformed explicit routes', async () => {
-    const harness = await startCliHarness();
-    try {
-      harness.sendLine('@codex');
-      await harness.waitForText('Invalid format. Use "@agent message".');
-
-      harness.sendLine('@');
-      await harness.waitForText('Invalid format. Use "@agent message".');
-
-      harness.sendLine('/status');
-      await harness.waitForText('[status]');
-    } finally {
-      await harness.stop();
-    }
-
-    expect(harness.process.killed || harness.process.exitCode !== null).toBe(true);
+    const harness = requireHarness();
+    let mark = harness.mark();
+    harness.sendLine('@codex');
+    await harness.waitForText('Invalid format. Use "@agent message".', undefined, mark);
+
+    mark = harness.mark();
+    harness.sendLine('@');
+    await harness.waitForText('Invalid format. Use "@agent message".', undefined, mark);
+
+    mark = harness.mark();
+    harness.sendLine('/status');
+    await harness.waitForText('[status]', undefined, mark);
   }, 30000);
 });
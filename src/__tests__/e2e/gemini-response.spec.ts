@@ -1,35 +1,13 @@
 import { afterAll, beforeAll, describe, expect, it } from 'vitest';
 import { spawn, spawnSync, ChildProcess } from 'child_process';
-import * as net from 'net';
 import * as path from 'path';
 import * as url from 'url';
 import { setTimeout as sleep } from 'timers/promises';
+import { getFreePort, waitForProcessOutput } from './cli-process-harness.js';
 
 const __dirname = url.fileURLToPath(new URL('.', import.meta.url));
 const CLI_PATH = path.resolve(__dirname, '../../../dist/cli.js');
 
-async function getFreePort(): Promise<number> {
-  return new Promise<number>((resolve, reject) => {
-    const server = net.createServer();
-    server.on('error', reject);
-    server.listen(0, '127.0.0.1', () => {
-      const address = server.address();
-      if (!address || typeof address === 'string') {
-        server.close(() => reject(new Error('Failed to allocate free port')));
-        return;
-      }
-      const selected = address.port;
-      server.close((closeErr) => {
-        if (closeErr) {
-          reject(closeErr);
-          return;
-        }
-        resolve(selected);
-      });
-    });
-  });
-}
-
 function canRunGeminiResponseE2E(): boolean {
   if (process.env.AITEAM_RUN_REAL_GEMINI_E2E !== '1') {
     return false;
@@ -52,16 +30,14 @@ describeRealGemini('E2E: Gemini direct response', () => {
   let cliProcess: ChildProcess;
   let outputBuffer = '';
 
-  const waitForText = async (needle: string, timeoutMs = 120000) => {
-    const deadline = Date.now() + timeoutMs;
-    while (Date.now() < deadline) {
-      if (outputBuffer.includes(needle)) {
-        return;
-      }
-      await sleep(200);
-    }
-    throw new Error(`Timeout waiting for "${needle}"\nOutput tail:\n${outputBuffer.slice(-2000)}`);
-  };
+  const waitForText = (needle: string, timeoutMs = 120000) =>
+    waitForProcessOutput(
+      cliProcess,
+      () => outputBuffer,
+      needle,
+      timeoutMs,
+      () => `Timeout waiting for "${needle}"\nOutput tail:\n${outputBuffer.slice(-2000)}`
+    );
 
   beforeAll(async () => {
     const port = await getFreePort();
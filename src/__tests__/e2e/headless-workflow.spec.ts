@@ -2,6 +2,7 @@ import { describe, it, expect, beforeAll, afterAll } from 'vitest';
 import { spawn, ChildProcess } from 'child_process';
 import * as path from 'path';
 import * as url from 'url';
+import { waitForProcessOutput } from './cli-process-harness.js';
 
 const __dirname = url.fileURLToPath(new URL('.', import.meta.url));
 const CLI_PATH = path.resolve(__dirname, '../../../dist/cli.js');
@@ -10,6 +11,9 @@ describe('E2E: Headless Architecture Workflow', () => {
   let cliProcess: ChildProcess;
   let outputBuffer = '';
 
+  const waitForOutput = (needle: string, timeoutMs: number, timeoutLabel: string) =>
+    waitForProcessOutput(cliProcess, () => outputBuffer, needle, timeoutMs, () => timeoutLabel);
+
   beforeAll(async () => {
     // Start the CLI process
     cliProcess = spawn('node', [CLI_PATH], {
@@ -31,16 +35,7 @@ describe('E2E: Headless Architecture Workflow', () => {
     });
 
     // Wait for the CLI to be fully ready
-    await new Promise<void>((resolve, reject) => {
-      const timeout = setTimeout(() => reject(new Error('Timeout waiting for CLI ready')), 15000);
-      const interval = setInterval(() => {
-        if (outputBuffer.includes('Main agent: codex (default: codex)')) {
-          clearTimeout(timeout);
-          clearInterval(interval);
-          resolve();
-        }
-      }, 500);
-    });
+    await waitForOutput('Main agent: codex (default: codex)', 15000, 'Timeout waiting for CLI ready');
   }, 60000);
 
   afterAll(() => {
@@ -55,35 +50,13 @@ describe('E2E: Headless Architecture Workflow', () => {
 
     // Ensure codex is connected before first prompt to reduce startup flakiness.
     cliProcess.stdin!.write('/status' + String.fromCharCode(10));
-    await new Promise<void>((resolve, reject) => {
-      const timeout = setTimeout(
-        () => reject(new Error('Timeout waiting for codex connected status')),
-        20000
-      );
-      const interval = setInterval(() => {
-        if (outputBuffer.includes('- codex: connected')) {
-          clearTimeout(timeout);
-          clearInterval(interval);
-          resolve();
-        }
-      }, 500);
-    });
+    await waitForOutput('- codex: connected', 20000, 'Timeout waiting for codex connected status');
     
     // Send a prompt to codex
     cliProcess.stdin!.write('Hello, are you there?' + String.fromCharCode(10));
 
-    // Wait for codex response
-    await new Promise<void>((resolve, reject) => {
-      const timeout = setTimeout(() => reject(new Error('Timeout waiting for Codex response')), 45000);
-      const interval = setInterval(() => {
-        // We look for [codex] in the output indicating a response
-        if (outputBuffer.includes('[codex]')) {
-          clearTimeout(timeout);
-          clearInterval(interval);
-          resolve();
-        }
-      }, 500);
-    });
+    // Wait for codex response; [codex] in the output indicates a response
+    await waitForOutput('[codex]', 45000, 'Timeout waiting for Codex response');
 
     expect(outputBuffer).toContain('[codex]');
   }, 60000);
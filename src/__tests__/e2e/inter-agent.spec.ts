@@ -3,7 +3,8 @@ import { promises as fs } from 'fs';
 import * as path from 'path';
 import { setTimeout as sleep } from 'timers/promises';
 import { spawn } from 'child_process';
-import { WezTermSession, canRunWezTermE2E, getFreePort } from './wezterm-harness.js';
+import { getFreePort } from './cli-process-harness.js';
+import { WezTermSession, canRunWezTermE2E } from './wezterm-harness.js';
 
 const describeWithWezTerm = canRunWezTermE2E() ? describe : describe.skip;
 type PngFileMeta = { name: string; mtimeMs: number; size: number };
@@ -256,9 +257,9 @@ describeWithWezTerm('E2E: Inter-Agent Collaboration (WezTerm CLI, no mocks)', ()
     let communicationObserved = false;
     let statusBlock = '';
     let newPngFiles: string[] = [];
-    const communicationDeadline = Date.now() + 300000;
+    const communicationDeadline = performance.now() + 300000;
 
-    while (Date.now() < communicationDeadline) {
+    while (performance.now() < communicationDeadline) {
       await session.sendLine('/status');
       await sleep(900);
       const statusScreen = await session.getScreenText();
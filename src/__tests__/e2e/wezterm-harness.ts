@@ -1,6 +1,5 @@
 import { spawn, spawnSync } from 'child_process';
 import * as fs from 'fs';
-import * as net from 'net';
 import * as path from 'path';
 import { setTimeout as sleep } from 'timers/promises';
 
@@ -12,8 +11,10 @@ type ProcessResult = {
 
 const DEFAULT_SCROLLBACK_LINES = 600;
 const DEFAULT_POLL_INTERVAL_MS = 400;
+const INITIAL_POLL_INTERVAL_MS = 20;
+const POLL_BACKOFF_FACTOR = 1.6;
 const DEFAULT_WEZTERM_CLI_TIMEOUT_MS = 20000;
-const TRANSIENT_ERROR_MARKERS = ['os error 10054', 'connection refused', 'broken pipe'];
+const TRANSIENT_ERROR_PATTERN = /os error 10054|connection refused|broken pipe/i;
 const DEFAULT_E2E_DEBUG_LOG_DIR = path.join('tmp', 'e2e-debug');
 
 function collectLines(text: string): string[] {
@@ -35,8 +36,8 @@ function formatFailure(args: string[], result: ProcessResult): string {
 }
 
 function isTransientCliError(result: ProcessResult): boolean {
-  const combined = `${result.stdout}\n${result.stderr}`.toLowerCase();
-  return TRANSIENT_ERROR_MARKERS.some((marker) => combined.includes(marker));
+  // Match each stream in place; the full output is only concatenated by formatFailure.
+  return TRANSIENT_ERROR_PATTERN.test(result.stderr) || TRANSIENT_ERROR_PATTERN.test(result.stdout);
 }
 
 function parsePaneId(stdout: string, stderr: string): number {
@@ -100,7 +101,7 @@ async function runCommand(
   });
 }
 
-export function resolveWezTermExecutable(): string | null {
+function lookupWezTermExecutable(): string | null {
   const envPath = process.env.AITEAM_WEZTERM_EXE;
   if (envPath && fs.existsSync(envPath)) {
     return envPath;
@@ -128,6 +129,16 @@ export function resolveWezTermExecutable(): string | null {
   return firstLine ? firstLine : null;
 }
 
+// Each lookup may spawn where.exe, so resolve once per worker and reuse the result.
+let cachedWezTermExecutable: string | null | undefined;
+
+export function resolveWezTermExecutable(): string | null {
+  if (cachedWezTermExecutable === undefined) {
+    cachedWezTermExecutable = lookupWezTermExecutable();
+  }
+  return cachedWezTermExecutable;
+}
+
 export function canRunWezTermE2E(): boolean {
   const resolved = resolveWezTermExecutable();
   if (!resolved) {
@@ -145,29 +156,6 @@ export function canRunWezTermE2E(): boolean {
   return probe.status === 0;
 }
 
-export async function getFreePort(): Promise<number> {
-  return new Promise<number>((resolve, reject) => {
-    const server = net.createServer();
-    server.unref();
-    server.on('error', reject);
-    server.listen(0, '127.0.0.1', () => {
-      const address = server.address();
-      if (!address || typeof address === 'string') {
-        server.close(() => reject(new Error('Failed to allocate a test port.')));
-        return;
-      }
-      const selectedPort = address.port;
-      server.close((closeErr) => {
-        if (closeErr) {
-          reject(closeErr);
-          return;
-        }
-        resolve(selectedPort);
-      });
-    });
-  });
-}
-
 export class WezTermSession {
   private readonly cwd: string;
   private readonly weztermExe: string;
@@ -216,11 +204,17 @@ export class WezTermSession {
     this.paneId = await this.spawnPane();
     fs.mkdirSync(path.dirname(this.debugLogPath), { recursive: true });
 
-    await this.sendLine(`set PORT=${requestedPort}`);
-    await this.sendLine('set NO_COLOR=1');
-    await this.sendLine('set AITEAM_CLAUDE_TEXT_ONLY=1');
-    await this.sendLine(`set "AITEAM_DEBUG_LOG_FILE=${this.debugLogPath}"`);
-    await this.sendLine(`node dist\\cli.js ${mainAgent}`);
+    // One send-text (one wezterm cli process) for the whole pane setup. Assignments are
+    // quoted so `&&` chaining does not leave trailing spaces in the values.
+    await this.sendLine(
+      [
+        `set "PORT=${requestedPort}"`,
+        'set "NO_COLOR=1"',
+        'set "AITEAM_CLAUDE_TEXT_ONLY=1"',
+        `set "AITEAM_DEBUG_LOG_FILE=${this.debugLogPath}"`,
+        `node dist\\cli.js ${mainAgent}`
+      ].join(' && ')
+    );
 
     const startupScreen = await this.waitForText(
       '--- aiteam CLI ---',
@@ -261,31 +255,19 @@ export class WezTermSession {
   }
 
   public async waitForText(needle: string, timeoutMs: number, timeoutLabel: string): Promise<string> {
-    const deadline = Date.now() + timeoutMs;
-    let latest = '';
-    while (Date.now() < deadline) {
-      latest = await this.getScreenText();
-      if (latest.includes(needle)) {
-        return latest;
-      }
-      await sleep(this.pollIntervalMs);
-    }
-    const tail = latest.slice(-1400);
-    throw new Error(`${timeoutLabel}\nNeedle: ${needle}\nLast screen tail:\n${tail}`);
+    return this.waitForScreen(
+      (screen) => screen.includes(needle),
+      timeoutMs,
+      `${timeoutLabel}\nNeedle: ${needle}`
+    );
   }
 
   public async waitForRegex(regex: RegExp, timeoutMs: number, timeoutLabel: string): Promise<string> {
-    const deadline = Date.now() + timeoutMs;
-    let latest = '';
-    while (Date.now() < deadline) {
-      latest = await this.getScreenText();
-      if (regex.test(latest)) {
-        return latest;
-      }
-      await sleep(this.pollIntervalMs);
-    }
-    const tail = latest.slice(-1400);
-    throw new Error(`${timeoutLabel}\nPattern: ${regex}\nLast screen tail:\n${tail}`);
+    return this.waitForScreen(
+      (screen) => regex.test(screen),
+      timeoutMs,
+      `${timeoutLabel}\nPattern: ${regex}`
+    );
   }
 
   public async shutdownAndDispose(): Promise<void> {
@@ -318,6 +300,26 @@ export class WezTermSession {
     return this.paneId;
   }
 
+  private async waitForScreen(
+    predicate: (screen: string) => boolean,
+    timeoutMs: number,
+    timeoutMessage: string
+  ): Promise<string> {
+    const deadline = performance.now() + timeoutMs;
+    let latest = '';
+    let delayMs = Math.min(INITIAL_POLL_INTERVAL_MS, this.pollIntervalMs);
+    while (performance.now() < deadline) {
+      latest = await this.getScreenText();
+      if (predicate(latest)) {
+        return latest;
+      }
+      await sleep(delayMs);
+      delayMs = Math.min(Math.ceil(delayMs * POLL_BACKOFF_FACTOR), this.pollIntervalMs);
+    }
+    const tail = latest.slice(-1400);
+    throw new Error(`${timeoutMessage}\nLast screen tail:\n${tail}`);
+  }
+
   private async spawnPane(): Promise<number> {
     const result = await this.runCliCommand([
       'cli',
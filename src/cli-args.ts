@@ -0,0 +1,72 @@
+// Pure argument parsing and help text for the CLI. Kept free of hub/adapter/ws imports so
+// it can be loaded (and unit-tested) without pulling in the runtime.
+export const SUPPORTED_AGENTS = ['codex', 'claude', 'gemini'] as const;
+export type SupportedAgentId = (typeof SUPPORTED_AGENTS)[number];
+export const DEFAULT_MAIN_AGENT: SupportedAgentId = 'codex';
+
+function isSupportedAgentId(value: string): value is SupportedAgentId {
+  return SUPPORTED_AGENTS.includes(value as SupportedAgentId);
+}
+
+export function printAiOrientedHelp() {
+  console.log('aiteam - Agent Team CLI');
+  console.log('');
+  console.log('Usage:');
+  console.log('  aiteam [main-agent]');
+  console.log('  aiteam -h | --help');
+  console.log('');
+  console.log(`Main agent choices: ${SUPPORTED_AGENTS.join(', ')} (default: ${DEFAULT_MAIN_AGENT})`);
+  console.log('');
+  console.log('Runtime model:');
+  console.log('- visible role: lead (single user-facing prompt)');
+  console.log('- main role: selected main agent receives plain-text user input');
+  console.log('- peer roles: other agents run headless and communicate via hub routing');
+  console.log('');
+  console.log('Input model:');
+  console.log('- plain text: sent to main agent');
+  console.log('- @<agent> <task>: direct route to specific agent');
+  console.log('- /status: print self/main/peer connectivity and routed counters');
+  console.log('- exit | quit: shutdown');
+  console.log('');
+  console.log('Inter-agent contract:');
+  console.log('- agents delegate with a single line: @<agent> <task>');
+  console.log('- supported agent ids: codex, claude, gemini');
+  console.log('- autonomy policy: prefer agent-to-agent collaboration before lead reporting');
+}
+
+export function parseCliArgs(argv: string[]): { showHelp: boolean; mainAgent: SupportedAgentId } {
+  let showHelp = false;
+  let mainAgent: SupportedAgentId = DEFAULT_MAIN_AGENT;
+  let hasMainAgentOverride = false;
+
+  for (const rawArg of argv) {
+    const arg = rawArg.trim();
+    if (!arg) {
+      continue;
+    }
+
+    if (arg === '-h' || arg === '--help') {
+      showHelp = true;
+      continue;
+    }
+
+    if (arg.startsWith('-')) {
+      throw new Error(`Unknown option: ${arg}`);
+    }
+
+    if (hasMainAgentOverride) {
+      throw new Error(`Unexpected positional argument: ${arg}`);
+    }
+
+    if (!isSupportedAgentId(arg)) {
+      throw new Error(
+        `Unsupported main agent "${arg}". Supported: ${SUPPORTED_AGENTS.join(', ')}.`
+      );
+    }
+
+    hasMainAgentOverride = true;
+    mainAgent = arg;
+  }
+
+  return { showHelp, mainAgent };
+}
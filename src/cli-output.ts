@@ -0,0 +1,323 @@
+// Pure formatting of hub messages for the CLI. Kept free of hub/adapter/ws imports so
+// it can be loaded (and unit-tested) without pulling in the runtime.
+const IGNORED_RPC_METHODS = new Set([
+  'thread/started',
+  'thread/updated',
+  'turn/started',
+  'token_count'
+]);
+
+type JsonRecord = Record<string, unknown>;
+
+function asRecord(value: unknown): JsonRecord | null {
+  if (value && typeof value === 'object' && !Array.isArray(value)) {
+    return value as JsonRecord;
+  }
+  return null;
+}
+
+function normalizeText(text: string): string | null {
+  return text.trim().length > 0 ? text : null;
+}
+
+function normalizeType(value: unknown): string | null {
+  if (typeof value !== 'string') {
+    return null;
+  }
+  return value.replace(/[^a-z]/gi, '').toLowerCase();
+}
+
+function extractTextFromContent(content: unknown): string {
+  if (typeof content === 'string') {
+    return content;
+  }
+
+  if (!Array.isArray(content)) {
+    return '';
+  }
+
+  return content
+    .map((part) => {
+      if (typeof part === 'string') {
+        return part;
+      }
+      const partRecord = asRecord(part);
+      if (!partRecord) {
+        return '';
+      }
+      if (typeof partRecord.text === 'string') {
+        return partRecord.text;
+      }
+      if (typeof partRecord.output_text === 'string') {
+        return partRecord.output_text;
+      }
+      return '';
+    })
+    .join('');
+}
+
+function extractTextFromItem(item: unknown): string {
+  const itemRecord = asRecord(item);
+  if (!itemRecord) {
+    return '';
+  }
+
+  const role =
+    typeof itemRecord.role === 'string' ? itemRecord.role.toLowerCase() : null;
+  const itemType = normalizeType(itemRecord.type);
+  const isAssistantMessage =
+    role === 'assistant' || itemType === 'agentmessage';
+
+  if (!isAssistantMessage) {
+    return '';
+  }
+
+  const contentText = extractTextFromContent(itemRecord.content);
+  if (contentText) {
+    return contentText;
+  }
+  if (typeof itemRecord.text === 'string') {
+    return itemRecord.text;
+  }
+  if (typeof itemRecord.message === 'string') {
+    return itemRecord.message;
+  }
+  if (typeof itemRecord.output_text === 'string') {
+    return itemRecord.output_text;
+  }
+  return '';
+}
+
+function extractTextFromTurn(turn: unknown): string {
+  const turnRecord = asRecord(turn);
+  if (!turnRecord) {
+    return '';
+  }
+
+  const outputTexts: string[] = [];
+  if (Array.isArray(turnRecord.output)) {
+    outputTexts.push(...turnRecord.output.map((outputItem) => extractTextFromItem(outputItem)));
+  }
+  if (Array.isArray(turnRecord.items)) {
+    outputTexts.push(...turnRecord.items.map((turnItem) => extractTextFromItem(turnItem)));
+  }
+
+  return outputTexts.join('');
+}
+
+function extractTextFromEvent(event: unknown): string {
+  const eventRecord = asRecord(event);
+  if (!eventRecord) {
+    return '';
+  }
+
+  if (typeof eventRecord.text === 'string') {
+    return eventRecord.text;
+  }
+  if (typeof eventRecord.message === 'string') {
+    return eventRecord.message;
+  }
+  if (typeof eventRecord.output_text === 'string') {
+    return eventRecord.output_text;
+  }
+  if (typeof eventRecord.last_agent_message === 'string') {
+    return eventRecord.last_agent_message;
+  }
+
+  const itemRecord = asRecord(eventRecord.item);
+  if (itemRecord) {
+    return extractTextFromItem(itemRecord);
+  }
+
+  return extractTextFromContent(eventRecord.content);
+}
+
+function extractTextFromCodexEvent(payloadRecord: JsonRecord): string {
+  const method =
+    typeof payloadRecord.method === 'string' ? payloadRecord.method : null;
+  if (!method || !method.startsWith('codex/event/')) {
+    return '';
+  }
+
+  const paramsRecord = asRecord(payloadRecord.params);
+  if (!paramsRecord) {
+    return '';
+  }
+
+  const msgRecord =
+    asRecord(paramsRecord.msg) ??
+    asRecord(paramsRecord.event) ??
+    asRecord(paramsRecord.message);
+  if (!msgRecord) {
+    return '';
+  }
+
+  const eventType = typeof msgRecord.type === 'string' ? msgRecord.type : null;
+  if (method === 'codex/event/agent_message' || eventType === 'agent_message') {
+    if (typeof msgRecord.message === 'string') {
+      return msgRecord.message;
+    }
+    return extractTextFromItem(msgRecord.item);
+  }
+
+  if (method === 'codex/event/item_completed' || eventType === 'item_completed') {
+    return extractTextFromItem(msgRecord.item);
+  }
+
+  if (
+    method === 'codex/event/task_complete' ||
+    eventType === 'task_complete' ||
+    eventType === 'turn_complete'
+  ) {
+    if (typeof msgRecord.last_agent_message === 'string') {
+      return msgRecord.last_agent_message;
+    }
+  }
+
+  return '';
+}
+
+export function extractConversationalText(payload: unknown): string | null {
+  if (typeof payload === 'string') {
+    return normalizeText(payload);
+  }
+
+  const payloadRecord = asRecord(payload);
+  if (!payloadRecord) {
+    return null;
+  }
+
+  if (
+    typeof payloadRecord.method === 'string' &&
+    IGNORED_RPC_METHODS.has(payloadRecord.method)
+  ) {
+    return null;
+  }
+
+  if (typeof payloadRecord.error === 'string') {
+    const details: string[] = [];
+    if (typeof payloadRecord.target === 'string') {
+      details.push(`target=${payloadRecord.target}`);
+    }
+    if (typeof payloadRecord.reason === 'string') {
+      details.push(payloadRecord.reason);
+    }
+    if (typeof payloadRecord.exitCode === 'number') {
+      details.push(`exit=${payloadRecord.exitCode}`);
+    }
+    if (payloadRecord.timedOut === true) {
+      details.push('timedOut');
+    }
+
+    const suffix = details.length > 0 ? ` (${details.join(', ')})` : '';
+    return normalizeText(`${payloadRecord.error}${suffix}`);
+  }
+
+  const codexEventText = extractTextFromCodexEvent(payloadRecord);
+  if (normalizeText(codexEventText)) {
+    return codexEventText;
+  }
+
+  if (typeof payloadRecord.message === 'string') {
+    return normalizeText(payloadRecord.message);
+  }
+
+  const messageRecord = asRecord(payloadRecord.message);
+  if (messageRecord) {
+    const messageText = extractTextFromContent(messageRecord.content);
+    if (normalizeText(messageText)) {
+      return messageText;
+    }
+    if (typeof messageRecord.message === 'string') {
+      return normalizeText(messageRecord.message);
+    }
+  }
+
+  if (typeof payloadRecord.result === 'string') {
+    return normalizeText(payloadRecord.result);
+  }
+
+  const resultRecord = asRecord(payloadRecord.result);
+  if (resultRecord) {
+    if (typeof resultRecord.output_text === 'string') {
+      const outputText = normalizeText(resultRecord.output_text);
+      if (outputText) {
+        return outputText;
+      }
+    }
+
+    const turnText = extractTextFromTurn(resultRecord.turn);
+    if (normalizeText(turnText)) {
+      return turnText;
+    }
+
+    const resultContentText = extractTextFromContent(resultRecord.content);
+    if (normalizeText(resultContentText)) {
+      return resultContentText;
+    }
+  }
+
+  const paramsRecord = asRecord(payloadRecord.params);
+  if (paramsRecord) {
+    const itemText = extractTextFromItem(paramsRecord.item);
+    if (normalizeText(itemText)) {
+      return itemText;
+    }
+
+    const turnText = extractTextFromTurn(paramsRecord.turn);
+    if (normalizeText(turnText)) {
+      return turnText;
+    }
+
+    const eventText = extractTextFromEvent(paramsRecord.event);
+    if (normalizeText(eventText)) {
+      return eventText;
+    }
+  }
+
+  if (typeof payloadRecord.text === 'string') {
+    return normalizeText(payloadRecord.text);
+  }
+  if (typeof payloadRecord.output_text === 'string') {
+    return normalizeText(payloadRecord.output_text);
+  }
+
+  const contentText = extractTextFromContent(payloadRecord.content);
+  return normalizeText(contentText);
+}
+
+export function formatCliMessage(message: unknown): { from: string; text: string } | null {
+  const messageRecord = asRecord(message);
+  if (!messageRecord) {
+    return null;
+  }
+
+  if (typeof messageRecord.error === 'string') {
+    const details: string[] = [];
+    if (typeof messageRecord.target === 'string') {
+      details.push(`target=${messageRecord.target}`);
+    }
+    if (typeof messageRecord.reason === 'string') {
+      details.push(messageRecord.reason);
+    }
+    const suffix = details.length > 0 ? ` (${details.join(', ')})` : '';
+    return {
+      from: 'hub',
+      text: `${messageRecord.error}${suffix}`
+    };
+  }
+
+  if (typeof messageRecord.from !== 'string') {
+    return null;
+  }
+
+  const text = extractConversationalText(messageRecord.payload);
+  if (!text) {
+    return null;
+  }
+
+  return {
+    from: messageRecord.from,
+    text
+  };
+}
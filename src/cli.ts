@@ -3,6 +3,14 @@ import { CentralHub } from './index.js';
 import { CodexAdapter } from './adapters/codex.js';
 import { ClaudeAdapter } from './adapters/claude.js';
 import { GeminiAdapter } from './adapters/gemini.js';
+import {
+  DEFAULT_MAIN_AGENT,
+  SUPPORTED_AGENTS,
+  type SupportedAgentId,
+  parseCliArgs,
+  printAiOrientedHelp
+} from './cli-args.js';
+import { formatCliMessage } from './cli-output.js';
 import { WebSocket } from 'ws';
 import * as readline from 'readline';
 import * as net from 'net';
@@ -11,9 +19,6 @@ import * as path from 'path';
 import * as fs from 'fs';
 
 const DEFAULT_PORT = process.env.PORT ? parseInt(process.env.PORT, 10) : 4501;
-const SUPPORTED_AGENTS = ['codex', 'claude', 'gemini'] as const;
-type SupportedAgentId = (typeof SUPPORTED_AGENTS)[number];
-const DEFAULT_MAIN_AGENT: SupportedAgentId = 'codex';
 const CLI_MESSAGE_DEDUP_WINDOW_MS = 600;
 const parsedSysProgressInterval = process.env.AITEAM_SYS_PROGRESS_INTERVAL_MS
   ? parseInt(process.env.AITEAM_SYS_PROGRESS_INTERVAL_MS, 10)
@@ -22,394 +27,9 @@ const SYS_PROGRESS_MIN_INTERVAL_MS =
   Number.isFinite(parsedSysProgressInterval) && parsedSysProgressInterval > 0
     ? Math.max(1000, parsedSysProgressInterval)
     : 5000;
-const IGNORED_RPC_METHODS = new Set([
-  'thread/started',
-  'thread/updated',
-  'turn/started',
-  'token_count'
-]);
-
-type JsonRecord = Record<string, unknown>;
-
-function asRecord(value: unknown): JsonRecord | null {
-  if (value && typeof value === 'object' && !Array.isArray(value)) {
-    return value as JsonRecord;
-  }
-  return null;
-}
-
-function normalizeText(text: string): string | null {
-  return text.trim().length > 0 ? text : null;
-}
-
-function normalizeType(value: unknown): string | null {
-  if (typeof value !== 'string') {
-    return null;
-  }
-  return value.replace(/[^a-z]/gi, '').toLowerCase();
-}
-
-function extractTextFromContent(content: unknown): string {
-  if (typeof content === 'string') {
-    return content;
-  }
-
-  if (!Array.isArray(content)) {
-    return '';
-  }
-
-  return content
-    .map((part) => {
-      if (typeof part === 'string') {
-        return part;
-      }
-      const partRecord = asRecord(part);
-      if (!partRecord) {
-        return '';
-      }
-      if (typeof partRecord.text === 'string') {
-        return partRecord.text;
-      }
-      if (typeof partRecord.output_text === 'string') {
-        return partRecord.output_text;
-      }
-      return '';
-    })
-    .join('');
-}
-
-function extractTextFromItem(item: unknown): string {
-  const itemRecord = asRecord(item);
-  if (!itemRecord) {
-    return '';
-  }
-
-  const role =
-    typeof itemRecord.role === 'string' ? itemRecord.role.toLowerCase() : null;
-  const itemType = normalizeType(itemRecord.type);
-  const isAssistantMessage =
-    role === 'assistant' || itemType === 'agentmessage';
-
-  if (!isAssistantMessage) {
-    return '';
-  }
-
-  const contentText = extractTextFromContent(itemRecord.content);
-  if (contentText) {
-    return contentText;
-  }
-  if (typeof itemRecord.text === 'string') {
-    return itemRecord.text;
-  }
-  if (typeof itemRecord.message === 'string') {
-    return itemRecord.message;
-  }
-  if (typeof itemRecord.output_text === 'string') {
-    return itemRecord.output_text;
-  }
-  return '';
-}
-
-function extractTextFromTurn(turn: unknown): string {
-  const turnRecord = asRecord(turn);
-  if (!turnRecord) {
-    return '';
-  }
-
-  const outputTexts: string[] = [];
-  if (Array.isArray(turnRecord.output)) {
-    outputTexts.push(...turnRecord.output.map((outputItem) => extractTextFromItem(outputItem)));
-  }
-  if (Array.isArray(turnRecord.items)) {
-    outputTexts.push(...turnRecord.items.map((turnItem) => extractTextFromItem(turnItem)));
-  }
-
-  return outputTexts.join('');
-}
-
-function extractTextFromEvent(event: unknown): string {
-  const eventRecord = asRecord(event);
-  if (!eventRecord) {
-    return '';
-  }
-
-  if (typeof eventRecord.text === 'string') {
-    return eventRecord.text;
-  }
-  if (typeof eventRecord.message === 'string') {
-    return eventRecord.message;
-  }
-  if (typeof eventRecord.output_text === 'string') {
-    return eventRecord.output_text;
-  }
-  if (typeof eventRecord.last_agent_message === 'string') {
-    return eventRecord.last_agent_message;
-  }
-
-  const itemRecord = asRecord(eventRecord.item);
-  if (itemRecord) {
-    return extractTextFromItem(itemRecord);
-  }
-
-  return extractTextFromContent(eventRecord.content);
-}
-
-function extractTextFromCodexEvent(payloadRecord: JsonRecord): string {
-  const method =
-    typeof payloadRecord.method === 'string' ? payloadRecord.method : null;
-  if (!method || !method.startsWith('codex/event/')) {
-    return '';
-  }
-
-  const paramsRecord = asRecord(payloadRecord.params);
-  if (!paramsRecord) {
-    return '';
-  }
-
-  const msgRecord =
-    asRecord(paramsRecord.msg) ??
-    asRecord(paramsRecord.event) ??
-    asRecord(paramsRecord.message);
-  if (!msgRecord) {
-    return '';
-  }
-
-  const eventType = typeof msgRecord.type === 'string' ? msgRecord.type : null;
-  if (method === 'codex/event/agent_message' || eventType === 'agent_message') {
-    if (typeof msgRecord.message === 'string') {
-      return msgRecord.message;
-    }
-    return extractTextFromItem(msgRecord.item);
-  }
-
-  if (method === 'codex/event/item_completed' || eventType === 'item_completed') {
-    return extractTextFromItem(msgRecord.item);
-  }
-
-  if (
-    method === 'codex/event/task_complete' ||
-    eventType === 'task_complete' ||
-    eventType === 'turn_complete'
-  ) {
-    if (typeof msgRecord.last_agent_message === 'string') {
-      return msgRecord.last_agent_message;
-    }
-  }
-
-  return '';
-}
-
-export function extractConversationalText(payload: unknown): string | null {
-  if (typeof payload === 'string') {
-    return normalizeText(payload);
-  }
-
-  const payloadRecord = asRecord(payload);
-  if (!payloadRecord) {
-    return null;
-  }
-
-  if (
-    typeof payloadRecord.method === 'string' &&
-    IGNORED_RPC_METHODS.has(payloadRecord.method)
-  ) {
-    return null;
-  }
 
-  if (typeof payloadRecord.error === 'string') {
-    const details: string[] = [];
-    if (typeof payloadRecord.target === 'string') {
-      details.push(`target=${payloadRecord.target}`);
-    }
-    if (typeof payloadRecord.reason === 'string') {
-      details.push(payloadRecord.reason);
-    }
-    if (typeof payloadRecord.exitCode === 'number') {
-      details.push(`exit=${payloadRecord.exitCode}`);
-    }
-    if (payloadRecord.timedOut === true) {
-      details.push('timedOut');
-    }
-
-    const suffix = details.length > 0 ? ` (${details.join(', ')})` : '';
-    return normalizeText(`${payloadRecord.error}${suffix}`);
-  }
-
-  const codexEventText = extractTextFromCodexEvent(payloadRecord);
-  if (normalizeText(codexEventText)) {
-    return codexEventText;
-  }
-
-  if (typeof payloadRecord.message === 'string') {
-    return normalizeText(payloadRecord.message);
-  }
-
-  const messageRecord = asRecord(payloadRecord.message);
-  if (messageRecord) {
-    const messageText = extractTextFromContent(messageRecord.content);
-    if (normalizeText(messageText)) {
-      return messageText;
-    }
-    if (typeof messageRecord.message === 'string') {
-      return normalizeText(messageRecord.message);
-    }
-  }
-
-  if (typeof payloadRecord.result === 'string') {
-    return normalizeText(payloadRecord.result);
-  }
-
-  const resultRecord = asRecord(payloadRecord.result);
-  if (resultRecord) {
-    if (typeof resultRecord.output_text === 'string') {
-      const outputText = normalizeText(resultRecord.output_text);
-      if (outputText) {
-        return outputText;
-      }
-    }
-
-    const turnText = extractTextFromTurn(resultRecord.turn);
-    if (normalizeText(turnText)) {
-      return turnText;
-    }
-
-    const resultContentText = extractTextFromContent(resultRecord.content);
-    if (normalizeText(resultContentText)) {
-      return resultContentText;
-    }
-  }
-
-  const paramsRecord = asRecord(payloadRecord.params);
-  if (paramsRecord) {
-    const itemText = extractTextFromItem(paramsRecord.item);
-    if (normalizeText(itemText)) {
-      return itemText;
-    }
-
-    const turnText = extractTextFromTurn(paramsRecord.turn);
-    if (normalizeText(turnText)) {
-      return turnText;
-    }
-
-    const eventText = extractTextFromEvent(paramsRecord.event);
-    if (normalizeText(eventText)) {
-      return eventText;
-    }
-  }
-
-  if (typeof payloadRecord.text === 'string') {
-    return normalizeText(payloadRecord.text);
-  }
-  if (typeof payloadRecord.output_text === 'string') {
-    return normalizeText(payloadRecord.output_text);
-  }
-
-  const contentText = extractTextFromContent(payloadRecord.content);
-  return normalizeText(contentText);
-}
-
-export function formatCliMessage(message: unknown): { from: string; text: string } | null {
-  const messageRecord = asRecord(message);
-  if (!messageRecord) {
-    return null;
-  }
-
-  if (typeof messageRecord.error === 'string') {
-    const details: string[] = [];
-    if (typeof messageRecord.target === 'string') {
-      details.push(`target=${messageRecord.target}`);
-    }
-    if (typeof messageRecord.reason === 'string') {
-      details.push(messageRecord.reason);
-    }
-    const suffix = details.length > 0 ? ` (${details.join(', ')})` : '';
-    return {
-      from: 'hub',
-      text: `${messageRecord.error}${suffix}`
-    };
-  }
-
-  if (typeof messageRecord.from !== 'string') {
-    return null;
-  }
-
-  const text = extractConversationalText(messageRecord.payload);
-  if (!text) {
-    return null;
-  }
-
-  return {
-    from: messageRecord.from,
-    text
-  };
-}
-
-function isSupportedAgentId(value: string): value is SupportedAgentId {
-  return SUPPORTED_AGENTS.includes(value as SupportedAgentId);
-}
-
-function printAiOrientedHelp() {
-  console.log('aiteam - Agent Team CLI');
-  console.log('');
-  console.log('Usage:');
-  console.log('  aiteam [main-agent]');
-  console.log('  aiteam -h | --help');
-  console.log('');
-  console.log(`Main agent choices: ${SUPPORTED_AGENTS.join(', ')} (default: ${DEFAULT_MAIN_AGENT})`);
-  console.log('');
-  console.log('Runtime model:');
-  console.log('- visible role: lead (single user-facing prompt)');
-  console.log('- main role: selected main agent receives plain-text user input');
-  console.log('- peer roles: other agents run headless and communicate via hub routing');
-  console.log('');
-  console.log('Input model:');
-  console.log('- plain text: sent to main agent');
-  console.log('- @<agent> <task>: direct route to specific agent');
-  console.log('- /status: print self/main/peer connectivity and routed counters');
-  console.log('- exit | quit: shutdown');
-  console.log('');
-  console.log('Inter-agent contract:');
-  console.log('- agents delegate with a single line: @<agent> <task>');
-  console.log('- supported agent ids: codex, claude, gemini');
-  console.log('- autonomy policy: prefer agent-to-agent collaboration before lead reporting');
-}
-
-function parseCliArgs(argv: string[]): { showHelp: boolean; mainAgent: SupportedAgentId } {
-  let showHelp = false;
-  let mainAgent: SupportedAgentId = DEFAULT_MAIN_AGENT;
-  let hasMainAgentOverride = false;
-
-  for (const rawArg of argv) {
-    const arg = rawArg.trim();
-    if (!arg) {
-      continue;
-    }
-
-    if (arg === '-h' || arg === '--help') {
-      showHelp = true;
-      continue;
-    }
-
-    if (arg.startsWith('-')) {
-      throw new Error(`Unknown option: ${arg}`);
-    }
-
-    if (hasMainAgentOverride) {
-      throw new Error(`Unexpected positional argument: ${arg}`);
-    }
-
-    if (!isSupportedAgentId(arg)) {
-      throw new Error(
-        `Unsupported main agent "${arg}". Supported: ${SUPPORTED_AGENTS.join(', ')}.`
-      );
-    }
-
-    hasMainAgentOverride = true;
-    mainAgent = arg;
-  }
-
-  return { showHelp, mainAgent };
-}
+export { parseCliArgs, printAiOrientedHelp } from './cli-args.js';
+export { extractConversationalText, formatCliMessage } from './cli-output.js';
 
 async function canListenOnPort(port: number): Promise<boolean> {
   return new Promise<boolean>((resolve) => {
@@ -0,0 +1,9 @@
+import { configDefaults, defineConfig } from 'vitest/config';
+
+// Default tier: fast unit specs only. The e2e specs spawn the real CLI/agents and take
+// tens of seconds to minutes each; run them with `pnpm run test:e2e`.
+export default defineConfig({
+  test: {
+    exclude: [...configDefaults.exclude, 'src/__tests__/e2e/**']
+  }
+});
@@ -0,0 +1,8 @@
+import { defineConfig } from 'vitest/config';
+
+// Slow tier: real-agent e2e specs (see README "Testing").
+export default defineConfig({
+  test: {
+    include: ['src/__tests__/e2e/**/*.spec.ts']
+  }
+});